@@ -1,27 +1,88 @@
+import functools
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import KW_ONLY, InitVar, dataclass, field, fields
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 
+# Поддерживаемые расширения файлов по типам медиафайлов
+_AUDIO_EXTS = (".mp3", ".wav", ".flac")
+_VIDEO_EXTS = (".mp4", ".avi", ".mov")
+_IMAGE_EXTS = (".jpg", ".png", ".gif")
 
+
+class _InitVarProperty(property):
+    """
+    Свойство для одноименного InitVar dataclass: при обращении через класс возвращает None,
+    и dataclass использует это значение как значение аргумента по умолчанию.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None
+        return super().__get__(obj, objtype)
+
+
+@dataclass(slots=True, eq=False)
 class MediaFile(ABC):
     """
     Абстрактный базовый класс для всех медиафайлов.
     Содержит общие атрибуты и методы для всех типов медиафайлов.
     """
 
-    def __init__(
-        self, name: str, size: int, created_at: datetime = None, owner: str = None, metadata: Dict[str, Any] = None
-    ):
-        self.name = name
-        self.size = size
-        self.created_at = created_at or datetime.now()
-        self.owner = owner
-        self.metadata = metadata or {}
+    # Тип медиафайла; обязателен для каждого конкретного наследника (см. __init_subclass__)
+    FILE_TYPE = NotImplemented
+
+    name: str
+    size: int
+    _: KW_ONLY
+    # Аргументы конструктора; значения по умолчанию (None) дают одноименные свойства ниже
+    created_at: InitVar[Optional[datetime]]
+    owner: Optional[str] = None
+    metadata: InitVar[Optional[Dict[str, Any]]]
+    _created_at: Optional[datetime] = field(init=False, repr=False)
+    # Пользовательские метаданные; типовые поля хранятся в атрибутах наследников
+    _extra_metadata: Dict[str, Any] = field(init=False)
+
+    def __post_init__(self, created_at: Optional[datetime], metadata: Optional[Dict[str, Any]]):
+        self._created_at = created_at
+        self._extra_metadata = dict(metadata) if metadata else {}
+
+    def __init_subclass__(cls, **kwargs):
+        # slots=True пересоздает класс, поэтому super() без аргументов здесь не работает
+        super(MediaFile, cls).__init_subclass__(**kwargs)
+        # __abstractmethods__ еще не вычислен ABCMeta, поэтому конкретность проверяем по атрибутам класса
+        is_abstract = any(getattr(getattr(cls, attr, None), "__isabstractmethod__", False) for attr in dir(cls))
+        if cls.FILE_TYPE is NotImplemented and not is_abstract:
+            raise TypeError(f"{cls.__name__} must define FILE_TYPE")
+        # Генерируем __str__ с зашитым в код типом файла для каждого конкретного наследника
+        file_type = cls.__dict__.get("FILE_TYPE")
+        if file_type:
+            source = "def __str__(self):\n    return " + repr(f"{file_type}: ") + ' f"{self.name} ({self.size} bytes)"\n'
+            namespace = {}
+            exec(source, namespace)
+            namespace["__str__"].__qualname__ = f"{cls.__qualname__}.__str__"
+            cls.__str__ = namespace["__str__"]
+
+    @_InitVarProperty
+    def created_at(self) -> datetime:
+        """
+        Время создания медиафайла. Если оно не передано в конструктор, вычисляется
+        при первом обращении, то есть это время первого чтения, а не создания объекта.
+        """
+        value = self._created_at
+        if value is None:
+            value = self._created_at = datetime.now()
+        return value
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
 
-    @abstractmethod
     def get_file_type(self) -> str:
         """Возвращает тип медиафайла."""
-        pass
+        return self.FILE_TYPE
 
     @abstractmethod
     def extract_features(self) -> Dict[str, Any]:
@@ -33,35 +94,42 @@ class MediaFile(ABC):
         """Конвертирует медиафайл в другой формат."""
         pass
 
+    @_InitVarProperty
+    def metadata(self) -> Mapping[str, Any]:
+        """
+        Метаданные медиафайла только для чтения: типовые поля наследника вместе с пользовательскими.
+        Изменяются через update_metadata.
+        """
+        metadata = {name: getattr(self, name) for name in _metadata_fields(type(self))}
+        metadata.update(self._extra_metadata)
+        return MappingProxyType(metadata)
+
     def update_metadata(self, metadata: Dict[str, Any]) -> None:
-        """Обновляет метаданные медиафайла."""
-        self.metadata.update(metadata)
+        """Обновляет пользовательские метаданные медиафайла."""
+        self._extra_metadata.update(metadata)
 
     def __str__(self) -> str:
-        return f"{self.get_file_type()}: {self.name} ({self.size} bytes)"
+        return f"{self.FILE_TYPE}: {self.name} ({self.size} bytes)"
+
 
+@functools.lru_cache(maxsize=None)
+def _metadata_fields(cls: type) -> Tuple[str, ...]:
+    """Имена типовых полей наследника MediaFile, которые входят в metadata."""
+    base_fields = {f.name for f in fields(MediaFile)}
+    return tuple(f.name for f in fields(cls) if f.name not in base_fields)
 
+
+@dataclass(slots=True, eq=False)
 class AudioFile(MediaFile):
     """Класс для аудиофайлов с аудио-специфичными метаданными и операциями."""
 
-    def __init__(
-        self,
-        name: str,
-        size: int,
-        duration: float = None,
-        bitrate: int = None,
-        sample_rate: int = None,
-        channels: int = None,
-        **kwargs,
-    ):
-        super().__init__(name, size, **kwargs)
-        # Аудио-специфичные метаданные
-        self.metadata.update(
-            {"duration": duration, "bitrate": bitrate, "sample_rate": sample_rate, "channels": channels}
-        )
+    FILE_TYPE = "Audio"
 
-    def get_file_type(self) -> str:
-        return "Audio"
+    # Аудио-специфичные метаданные
+    duration: Optional[float] = None
+    bitrate: Optional[int] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
 
     def extract_features(self) -> Dict[str, Any]:
         """
@@ -79,8 +147,17 @@ class AudioFile(MediaFile):
         """Конвертирует аудиофайл в другой формат (mp3, wav и т.д.)."""
         print(f"Конвертация {self.name} в {target_format}")
         # В реальной реализации использовались бы библиотеки конвертации аудио
-        new_name = f"{self.name.split('.')[0]}.{target_format}"
-        return AudioFile(new_name, self.size, **self.metadata)
+        stem, _, _ = self.name.rpartition(".")
+        new_name = f"{stem or self.name}.{target_format}"
+        return AudioFile(
+            new_name,
+            self.size,
+            self.duration,
+            self.bitrate,
+            self.sample_rate,
+            self.channels,
+            metadata=self._extra_metadata,
+        )
 
     def adjust_volume(self, level: float) -> None:
         """Регулирует громкость аудиофайла."""
@@ -88,27 +165,17 @@ class AudioFile(MediaFile):
         # Реализация находилась бы здесь
 
 
+@dataclass(slots=True, eq=False)
 class VideoFile(MediaFile):
     """Класс для видеофайлов с видео-специфичными метаданными и операциями."""
 
-    def __init__(
-        self,
-        name: str,
-        size: int,
-        duration: float = None,
-        resolution: str = None,
-        frame_rate: float = None,
-        codec: str = None,
-        **kwargs,
-    ):
-        super().__init__(name, size, **kwargs)
-        # Видео-специфичные метаданные
-        self.metadata.update(
-            {"duration": duration, "resolution": resolution, "frame_rate": frame_rate, "codec": codec}
-        )
+    FILE_TYPE = "Video"
 
-    def get_file_type(self) -> str:
-        return "Video"
+    # Видео-специфичные метаданные
+    duration: Optional[float] = None
+    resolution: Optional[str] = None
+    frame_rate: Optional[float] = None
+    codec: Optional[str] = None
 
     def extract_features(self) -> Dict[str, Any]:
         """
@@ -126,39 +193,39 @@ class VideoFile(MediaFile):
         """Конвертирует видеофайл в другой формат (mp4, avi и т.д.)."""
         print(f"Конвертация {self.name} в {target_format}")
         # В реальной реализации использовались бы библиотеки конвертации видео
-        new_name = f"{self.name.split('.')[0]}.{target_format}"
-        return VideoFile(new_name, self.size, **self.metadata)
+        stem, _, _ = self.name.rpartition(".")
+        new_name = f"{stem or self.name}.{target_format}"
+        return VideoFile(
+            new_name,
+            self.size,
+            self.duration,
+            self.resolution,
+            self.frame_rate,
+            self.codec,
+            metadata=self._extra_metadata,
+        )
 
     def extract_frame(self, timestamp: float) -> "PhotoFile":
         """Извлекает кадр из видео в указанной временной метке."""
         print(f"Извлечение кадра в {timestamp} из {self.name}")
         # Реализация находилась бы здесь
-        frame_name = f"{self.name.split('.')[0]}_{timestamp}.jpg"
+        stem, _, _ = self.name.rpartition(".")
+        frame_name = f"{stem or self.name}_{timestamp}.jpg"
         # Предполагаем небольшой размер извлеченного кадра
         return PhotoFile(frame_name, 100000, width=1920, height=1080)
 
 
+@dataclass(slots=True, eq=False)
 class PhotoFile(MediaFile):
     """Класс для фотофайлов с фото-специфичными метаданными и операциями."""
 
-    def __init__(
-        self,
-        name: str,
-        size: int,
-        width: int = None,
-        height: int = None,
-        color_space: str = None,
-        camera_model: str = None,
-        **kwargs,
-    ):
-        super().__init__(name, size, **kwargs)
-        # Фото-специфичные метаданные
-        self.metadata.update(
-            {"width": width, "height": height, "color_space": color_space, "camera_model": camera_model}
-        )
+    FILE_TYPE = "Photo"
 
-    def get_file_type(self) -> str:
-        return "Photo"
+    # Фото-специфичные метаданные
+    width: Optional[int] = None
+    height: Optional[int] = None
+    color_space: Optional[str] = None
+    camera_model: Optional[str] = None
 
     def extract_features(self) -> Dict[str, Any]:
         """
@@ -176,17 +243,65 @@ class PhotoFile(MediaFile):
         """Конвертирует фотофайл в другой формат (jpg, png и т.д.)."""
         print(f"Конвертация {self.name} в {target_format}")
         # В реальной реализации использовались бы библиотеки конвертации изображений
-        new_name = f"{self.name.split('.')[0]}.{target_format}"
-        return PhotoFile(new_name, self.size, **self.metadata)
+        stem, _, _ = self.name.rpartition(".")
+        new_name = f"{stem or self.name}.{target_format}"
+        return PhotoFile(
+            new_name,
+            self.size,
+            self.width,
+            self.height,
+            self.color_space,
+            self.camera_model,
+            metadata=self._extra_metadata,
+        )
 
     def resize(self, width: int, height: int) -> "PhotoFile":
         """Изменяет размер фото до указанных размеров."""
         print(f"Изменение размера {self.name} до {width}x{height}")
         # Реализация находилась бы здесь
-        new_name = f"{self.name.split('.')[0]}_resized.{self.name.split('.')[-1]}"
+        stem, sep, ext = self.name.rpartition(".")
+        new_name = f"{stem}_resized.{ext}" if sep else f"{self.name}_resized"
         return PhotoFile(new_name, self.size, width=width, height=height)
 
 
+# Соответствие расширения файла (без точки, в нижнем регистре) классу медиафайла
+_EXT_TO_CLASS = {
+    **dict.fromkeys((ext[1:] for ext in _AUDIO_EXTS), AudioFile),
+    **dict.fromkeys((ext[1:] for ext in _VIDEO_EXTS), VideoFile),
+    **dict.fromkeys((ext[1:] for ext in _IMAGE_EXTS), PhotoFile),
+}
+
+# Размер по умолчанию для файлов, загружаемых из хранилищ (упрощенный пример)
+_DEFAULT_SIZES = {AudioFile: 1_000_000, VideoFile: 5_000_000, PhotoFile: 500_000}
+
+
+@functools.lru_cache(maxsize=64)
+def _classify(ext: str) -> type:
+    """Возвращает класс медиафайла для расширения в нижнем регистре без точки (например, "mp3")."""
+    cls = _EXT_TO_CLASS.get(ext)
+    if cls is None:
+        raise ValueError(f"Неподдерживаемое расширение файла: {ext!r}")
+    return cls
+
+
+def _resolve(path: str) -> Tuple[str, type]:
+    """Возвращает имя файла и класс медиафайла для пути; ValueError, если тип файла не поддерживается."""
+    filename = path.rpartition("/")[2]
+    _, sep, ext = filename.rpartition(".")
+    if sep:
+        try:
+            return filename, _classify(ext.lower())
+        except ValueError:
+            pass
+    raise ValueError(f"Неподдерживаемый тип файла: {path}")
+
+
+def _default_load(path: str) -> MediaFile:
+    """Создает медиафайл по пути с размером по умолчанию для его типа (общая логика Storage.load)."""
+    filename, cls = _resolve(path)
+    return cls(filename, _DEFAULT_SIZES[cls])
+
+
 class Storage(ABC):
     """
     Абстрактный базовый класс для различных типов хранилищ.
@@ -228,14 +343,7 @@ class LocalStorage(Storage):
         print(f"Загрузка файла с локального диска из {path}")
         # Реализация определяла бы тип файла и создавала соответствующий объект
         # Упрощенный пример
-        if path.endswith((".mp3", ".wav", ".flac")):
-            return AudioFile(path.split("/")[-1], 1000000)
-        elif path.endswith((".mp4", ".avi", ".mov")):
-            return VideoFile(path.split("/")[-1], 5000000)
-        elif path.endswith((".jpg", ".png", ".gif")):
-            return PhotoFile(path.split("/")[-1], 500000)
-        else:
-            raise ValueError(f"Неподдерживаемый тип файла: {path}")
+        return _default_load(path)
 
     def delete(self, path: str) -> bool:
         """Удаляет медиафайл с локального диска."""
@@ -254,7 +362,8 @@ class CloudStorage(Storage):
     """Реализация хранилища для облачного хранилища (Google Drive, Dropbox)."""
 
     def __init__(self, provider: str, credentials: Dict[str, str]):
-        self.provider = provider
+        # Имена провайдеров повторяются между экземплярами
+        self.provider = sys.intern(provider)
         self.credentials = credentials
 
     def save(self, media_file: MediaFile, path: str) -> bool:
@@ -268,14 +377,7 @@ class CloudStorage(Storage):
         print(f"Загрузка файла из облака {self.provider} из {path}")
         # Реализация использовала бы API облачного провайдера
         # Упрощенный пример
-        if path.endswith((".mp3", ".wav", ".flac")):
-            return AudioFile(path.split("/")[-1], 1000000)
-        elif path.endswith((".mp4", ".avi", ".mov")):
-            return VideoFile(path.split("/")[-1], 5000000)
-        elif path.endswith((".jpg", ".png", ".gif")):
-            return PhotoFile(path.split("/")[-1], 500000)
-        else:
-            raise ValueError(f"Неподдерживаемый тип файла: {path}")
+        return _default_load(path)
 
     def delete(self, path: str) -> bool:
         """Удаляет медиафайл из облачного хранилища."""
@@ -310,14 +412,7 @@ class RemoteStorage(Storage):
         print(f"Загрузка файла с удаленного сервера {self.host}:{self.port}/{path}")
         # Реализация использовала бы библиотеки FTP/SFTP
         # Упрощенный пример
-        if path.endswith((".mp3", ".wav", ".flac")):
-            return AudioFile(path.split("/")[-1], 1000000)
-        elif path.endswith((".mp4", ".avi", ".mov")):
-            return VideoFile(path.split("/")[-1], 5000000)
-        elif path.endswith((".jpg", ".png", ".gif")):
-            return PhotoFile(path.split("/")[-1], 500000)
-        else:
-            raise ValueError(f"Неподдерживаемый тип файла: {path}")
+        return _default_load(path)
 
     def delete(self, path: str) -> bool:
         """Удаляет медиафайл с удаленного сервера."""
@@ -352,14 +447,7 @@ class S3Storage(Storage):
         print(f"Загрузка файла из S3-бакета {self.bucket}/{path}")
         # Реализация использовала бы S3 API
         # Упрощенный пример
-        if path.endswith((".mp3", ".wav", ".flac")):
-            return AudioFile(path.split("/")[-1], 1000000)
-        elif path.endswith((".mp4", ".avi", ".mov")):
-            return VideoFile(path.split("/")[-1], 5000000)
-        elif path.endswith((".jpg", ".png", ".gif")):
-            return PhotoFile(path.split("/")[-1], 500000)
-        else:
-            raise ValueError(f"Неподдерживаемый тип файла: {path}")
+        return _default_load(path)
 
     def delete(self, path: str) -> bool:
         """Удаляет медиафайл из S3-бакета."""
@@ -381,15 +469,20 @@ class MediaFileFactory:
     @staticmethod
     def create_from_path(path: str, size: int, **kwargs) -> MediaFile:
         """Создает объект MediaFile на основе расширения файла."""
-        filename = path.split("/")[-1]
-        if path.endswith((".mp3", ".wav", ".flac")):
-            return AudioFile(filename, size, **kwargs)
-        elif path.endswith((".mp4", ".avi", ".mov")):
-            return VideoFile(filename, size, **kwargs)
-        elif path.endswith((".jpg", ".png", ".gif")):
-            return PhotoFile(filename, size, **kwargs)
-        else:
-            raise ValueError(f"Неподдерживаемый тип файла: {path}")
+        filename, cls = _resolve(path)
+        return cls(filename, size, **kwargs)
+
+    @staticmethod
+    def specialize(ext: str) -> Callable[..., MediaFile]:
+        """
+        Возвращает конструктор для файлов с заданным расширением ("jpg" или ".jpg").
+        Сгенерированная функция не определяет тип файла, а сразу создает объект нужного класса.
+        """
+        target = _classify((ext[1:] if ext.startswith(".") else ext).lower())
+        source = "def make(path, size, **kwargs):\n    return target(path.rpartition('/')[2], size, **kwargs)\n"
+        namespace = {"target": target}
+        exec(source, namespace)
+        return namespace["make"]
 
 
 # Пример использования
@@ -411,7 +504,7 @@ def main():
     # Обновление метаданных
     audio.update_metadata({"genre": "Rock", "artist": "Unknown"})
     print("\n--- Обновленные метаданные аудио ---")
-    print(f"Метаданные аудио: {audio.metadata}")
+    print(f"Метаданные аудио: {dict(audio.metadata)}")
 
     # Конвертация файлов
     new_audio = audio.convert("wav")
@@ -1,4 +1,4 @@
-from main import AudioFile, VideoFile, PhotoFile, LocalStorage, CloudStorage, S3Storage
+from main import AudioFile, VideoFile, PhotoFile, LocalStorage, CloudStorage, S3Storage, MediaFileFactory
 
 # Создание медиафайлов
 audio = AudioFile("song.mp3", 5000000, duration=240, bitrate=320, 
@@ -16,7 +16,7 @@ print(photo)
 
 # Вывод метаданных аудиофайла
 print("\nМетаданные аудиофайла:")
-print(audio.metadata)
+print(dict(audio.metadata))
 
 # Создание экземпляров хранилищ
 local_storage = LocalStorage()
@@ -27,4 +27,17 @@ s3_storage = S3Storage("media-bucket", "us-west-2", "access_key", "secret_key")
 print("\nЭкземпляры хранилищ:")
 print(f"Локальное хранилище: {local_storage.__class__.__name__}")
 print(f"Облачное хранилище: {cloud_storage.__class__.__name__}, Поставщик: {cloud_storage.provider}")
-print(f"S3 хранилище: {s3_storage.__class__.__name__}, Бакет: {s3_storage.bucket}")
\ No newline at end of file
+print(f"S3 хранилище: {s3_storage.__class__.__name__}, Бакет: {s3_storage.bucket}")
+
+# Специализированный конструктор фабрики
+make_photo = MediaFileFactory.specialize(".jpg")
+photo_from_factory = make_photo("photos/new_image.jpg", 1500000, width=800)
+assert isinstance(photo_from_factory, PhotoFile)
+assert photo_from_factory.name == "new_image.jpg" and photo_from_factory.width == 800
+assert isinstance(MediaFileFactory.specialize("MOV")("clip.mov", 1), VideoFile)
+try:
+    MediaFileFactory.specialize(".txt")
+    raise AssertionError("specialize должен бросить ValueError")
+except ValueError as exc:
+    print(f"\nОшибка specialize: {exc}")
+print(f"Файл из специализированного конструктора: {photo_from_factory}")
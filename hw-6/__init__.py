@@ -4,6 +4,8 @@
 
 from . import base, car, engine, exceptions, plane
 
+# fleet не импортируется здесь: он требует numpy и numba и компилирует ядро при импорте
+
 __all__ = [
     "base",
     "car",
@@ -7,15 +7,13 @@ from exceptions import LowFuelError, NotEnoughFuel
 
 
 class Vehicle(ABC):
-    weight = 0
-    started = False
-    fuel = 0
-    fuel_consumption = 0
+    __slots__ = ("weight", "started", "fuel", "fuel_consumption")
     
     def __init__(self, weight=0, fuel=0, fuel_consumption=0):
         self.weight = weight
         self.fuel = fuel
         self.fuel_consumption = fuel_consumption
+        self.started = False
     
     def start(self):
         if not self.started:
@@ -24,9 +22,13 @@ class Vehicle(ABC):
             else:
                 raise LowFuelError("Cannot start vehicle with no fuel")
     
-    def move(self, distance):
+    def try_move(self, distance):
         fuel_needed = distance * self.fuel_consumption
-        if self.fuel >= fuel_needed:
+        ok = self.fuel >= fuel_needed
+        if ok:
             self.fuel -= fuel_needed
-        else:
-            raise NotEnoughFuel(f"Need {fuel_needed} fuel, but only have {self.fuel}")
+        return ok
+    
+    def move(self, distance):
+        if not self.try_move(distance):
+            raise NotEnoughFuel(f"Need {distance * self.fuel_consumption} fuel, but only have {self.fuel}")
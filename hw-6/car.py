@@ -7,7 +7,11 @@ from engine import Engine
 
 
 class Car(Vehicle):
-    engine = None
+    __slots__ = ("engine",)
+    
+    def __init__(self, weight=0, fuel=0, fuel_consumption=0):
+        super().__init__(weight, fuel, fuel_consumption)
+        self.engine = None
     
     def set_engine(self, engine: Engine):
         self.engine = engine
@@ -8,14 +8,26 @@
 
 class LowFuelError(Exception):
     def __init__(self, message):
-        self.message = "Low Fuel: " + message
+        super().__init__("Low Fuel: " + message)
+
+    @property
+    def message(self):
+        return self.args[0]
 
 
 class NotEnoughFuel(Exception):
     def __init__(self, message):
-        self.message = "Not Enough Fuel: " + message
+        super().__init__("Not Enough Fuel: " + message)
+
+    @property
+    def message(self):
+        return self.args[0]
 
 
 class CargoOverload(Exception):
     def __init__(self, message):
-        self.message = "Cargo Over load: " + message
+        super().__init__("Cargo Over load: " + message)
+
+    @property
+    def message(self):
+        return self.args[0]
@@ -0,0 +1,56 @@
+"""
+Пакетное перемещение парка `Vehicle` с помощью Numba
+
+Требует numpy и numba (остальные модули задания от них не зависят);
+ядро компилируется при импорте модуля.
+"""
+
+import numpy as np
+from numba import boolean, float64, njit, prange
+
+from exceptions import NotEnoughFuel
+
+
+@njit(boolean[:](float64[:], float64[:], float64[:]), parallel=True, cache=True)
+def move_fleet(fuel, fuel_consumption, distance):
+    """Перемещает все машины разом, уменьшая `fuel` на месте; возвращает маску успешных перемещений."""
+    ok = np.empty(fuel.shape[0], dtype=np.bool_)
+    for i in prange(fuel.shape[0]):
+        needed = distance[i] * fuel_consumption[i]
+        ok[i] = fuel[i] >= needed
+        if ok[i]:
+            fuel[i] -= needed
+    return ok
+
+
+def _is_integral(*values):
+    return all(isinstance(value, (int, np.integer)) for value in values)
+
+
+def move_vehicles(vehicles, distances):
+    """
+    Перемещает каждую машину из `vehicles` на соответствующее расстояние из `distances`.
+    Результат для каждой машины тот же, что у `Vehicle.try_move`: машины, которым хватает
+    топлива, перемещаются, остальные не меняются; если таких машин нет, после обновления
+    остальных бросается `NotEnoughFuel` с их индексами.
+
+    Дробные значения считаются ядром `move_fleet` в float64 (как float в Python).
+    Машины, у которых топливо, расход и расстояние целые, считаются в Python через
+    `try_move`: float64 точно представляет целые только до 2**53.
+    """
+    if len(vehicles) != len(distances):
+        raise ValueError(f"Got {len(distances)} distances for {len(vehicles)} vehicles")
+    fuel = np.array([vehicle.fuel for vehicle in vehicles], dtype=np.float64)
+    fuel_consumption = np.array([vehicle.fuel_consumption for vehicle in vehicles], dtype=np.float64)
+    distance = np.array(distances, dtype=np.float64)
+
+    moved = move_fleet(fuel, fuel_consumption, distance).tolist()
+    for i, (vehicle, step, remaining) in enumerate(zip(vehicles, distances, fuel.tolist())):
+        if _is_integral(vehicle.fuel, vehicle.fuel_consumption, step):
+            moved[i] = vehicle.try_move(int(step))
+        elif moved[i]:
+            vehicle.fuel = remaining
+
+    failed = [i for i, ok in enumerate(moved) if not ok]
+    if failed:
+        raise NotEnoughFuel(f"Vehicles {failed} cannot move the requested distance")
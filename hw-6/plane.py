@@ -7,17 +7,21 @@ from exceptions import CargoOverload
 
 
 class Plane(Vehicle):
-    cargo = 0
-    max_cargo = 0
+    __slots__ = ("cargo", "max_cargo")
     
     def __init__(self, weight=0, fuel=0, fuel_consumption=0, max_cargo=0):
         super().__init__(weight, fuel, fuel_consumption)
+        self.cargo = 0
         self.max_cargo = max_cargo
     
-    def load_cargo(self, amount):
-        if self.cargo + amount <= self.max_cargo:
+    def try_load_cargo(self, amount):
+        ok = self.cargo + amount <= self.max_cargo
+        if ok:
             self.cargo += amount
-        else:
+        return ok
+    
+    def load_cargo(self, amount):
+        if not self.try_load_cargo(amount):
             raise CargoOverload(f"Cannot load {amount} cargo. Current: {self.cargo}, Max: {self.max_cargo}")
     
     def remove_all_cargo(self):
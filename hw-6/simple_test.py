@@ -0,0 +1,91 @@
+from car import Car
+from exceptions import CargoOverload, LowFuelError, NotEnoughFuel
+from plane import Plane
+
+# try_move: успешное перемещение расходует топливо
+car = Car(1000, 10, 2)
+assert car.try_move(3) is True
+assert car.fuel == 4
+# Неудачное перемещение возвращает False и не меняет состояние
+assert car.try_move(3) is False
+assert car.fuel == 4
+print(f"Car после try_move: fuel={car.fuel}")
+
+# move бросает NotEnoughFuel, топливо не меняется
+try:
+    car.move(3)
+    raise AssertionError("move должен бросить NotEnoughFuel")
+except NotEnoughFuel as exc:
+    assert str(exc) == "Not Enough Fuel: Need 6 fuel, but only have 4"
+    print(f"NotEnoughFuel: {exc}")
+assert car.fuel == 4
+
+# try_load_cargo: загрузка в пределах max_cargo
+plane = Plane(5000, 100, 1, max_cargo=10)
+assert plane.try_load_cargo(7) is True
+assert plane.cargo == 7
+# Перегрузка возвращает False и не меняет груз
+assert plane.try_load_cargo(4) is False
+assert plane.cargo == 7
+print(f"Plane после try_load_cargo: cargo={plane.cargo}")
+
+# load_cargo бросает CargoOverload, груз не меняется
+try:
+    plane.load_cargo(4)
+    raise AssertionError("load_cargo должен бросить CargoOverload")
+except CargoOverload as exc:
+    assert str(exc) == "Cargo Over load: Cannot load 4 cargo. Current: 7, Max: 10"
+    print(f"CargoOverload: {exc}")
+assert plane.cargo == 7
+assert plane.remove_all_cargo() == 7 and plane.cargo == 0
+
+# start без топлива бросает LowFuelError
+try:
+    Car(1000, 0, 1).start()
+    raise AssertionError("start должен бросить LowFuelError")
+except LowFuelError as exc:
+    assert str(exc) == "Low Fuel: Cannot start vehicle with no fuel"
+    assert exc.message == str(exc)
+    print(f"LowFuelError: {exc}")
+
+# Пакетное перемещение (fleet); требует numpy и numba
+try:
+    import numpy as np
+    from fleet import move_vehicles
+except ImportError:
+    print("fleet пропущен: numpy/numba не установлены")
+else:
+    # Для каждого случая пакетный результат совпадает с Vehicle.move: успех, значение и тип топлива
+    cases = [
+        (0.3, 0.1, 3),
+        (100, 0.1, 3),
+        (10, 2, 3),
+        (10, 2, 6),
+        (5, 0.5, 2.5),
+        (2**60, 1, 1),
+        (10, 1, np.int64(3)),
+    ]
+    for fuel, fuel_consumption, distance in cases:
+        scalar = Car(1, fuel, fuel_consumption)
+        scalar_ok = scalar.try_move(int(distance) if isinstance(distance, np.integer) else distance)
+        batch = Car(1, fuel, fuel_consumption)
+        try:
+            move_vehicles([batch], [distance])
+            batch_ok = True
+        except NotEnoughFuel:
+            batch_ok = False
+        assert (scalar_ok, type(scalar.fuel), scalar.fuel) == (batch_ok, type(batch.fuel), batch.fuel), (
+            fuel,
+            fuel_consumption,
+            distance,
+        )
+
+    # Смешанный парк: успешные машины обновляются, неудачные перечислены в исключении
+    fleet = [Car(1, 10, 1), Car(1, 1, 1), Car(1, 100, 0.1)]
+    try:
+        move_vehicles(fleet, [3, 3, 3])
+        raise AssertionError("move_vehicles должен бросить NotEnoughFuel")
+    except NotEnoughFuel as exc:
+        assert str(exc) == "Not Enough Fuel: Vehicles [1] cannot move the requested distance"
+    assert [car.fuel for car in fleet] == [7, 1, 99.7]
+    print(f"Парк после move_vehicles: {[car.fuel for car in fleet]}")